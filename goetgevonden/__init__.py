@@ -12,7 +12,10 @@ Example:
     >>> print(f"Found {results.total} results")
 """
 
-from .client import GoetGevondenClient, create_client
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     APIError,
     ConnectionError,
@@ -33,6 +36,10 @@ from .models import (
     ViewScope,
 )
 
+if TYPE_CHECKING:
+    from .async_client import AsyncGoetGevondenClient
+    from .client import GoetGevondenClient, create_client
+
 __version__ = "0.1.0"
 __author__ = "GoetGevonden Contributors"
 __license__ = "MIT"
@@ -59,3 +66,26 @@ __all__ = [
     "NotFoundError",
     "ValidationError",
 ]
+
+# Star imports resolve every name in __all__, so only list the async client
+# when its optional httpx dependency is installed.
+if importlib.util.find_spec("httpx") is not None:
+    __all__ += ["AsyncGoetGevondenClient"]
+
+
+# The clients pull in requests (and httpx for the async client), so they are
+# only imported when first accessed; the models and exceptions stay import-light.
+_LAZY_IMPORTS = {
+    "GoetGevondenClient": ".client",
+    "create_client": ".client",
+    "AsyncGoetGevondenClient": ".async_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,161 @@
+"""
+HTTP/2 transport for the synchronous GoetGevonden client.
+
+Provides a minimal stand-in for ``requests.Session`` backed by ``httpx.Client``,
+so :class:`~goetgevonden.client.GoetGevondenClient` can multiplex concurrent
+requests over a single HTTP/2 connection. Requires the optional ``async``
+extra, which installs ``httpx[http2]``.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any
+
+import httpx
+import requests
+
+
+@contextmanager
+def _translate_errors() -> Iterator[None]:
+    """Re-raise httpx transport errors as the equivalent ``requests`` exceptions."""
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.Timeout(str(e)) from e
+    except httpx.TransportError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+
+
+class HTTP2Response:
+    """Wrap an ``httpx.Response`` with the parts of the requests API the client uses."""
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status code of the response."""
+        return self._response.status_code
+
+    @property
+    def content(self) -> bytes:
+        """Response body, downloading it first for streamed responses."""
+        with _translate_errors():
+            return self._response.read()
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as text."""
+        with _translate_errors():
+            self._response.read()
+        return self._response.text
+
+    def iter_content(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        """Iterate over the decoded response body in chunks."""
+        with _translate_errors():
+            yield from self._response.iter_bytes(chunk_size)
+
+    def close(self) -> None:
+        """Release the underlying connection."""
+        self._response.close()
+
+    def __enter__(self) -> "HTTP2Response":
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and close the response."""
+        self.close()
+
+
+class HTTP2Session:
+    """
+    Minimal ``requests.Session`` stand-in backed by an HTTP/2 ``httpx.Client``.
+
+    httpx errors are re-raised as the equivalent ``requests`` exceptions, so
+    the client's existing error translation applies unchanged.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 8,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        """
+        Initialize the HTTP/2 session.
+
+        Args:
+            max_connections: Maximum number of connections to keep open.
+                Defaults to 8.
+            transport: Optional httpx transport to send requests through instead
+                of the network, e.g. ``httpx.MockTransport`` in tests.
+        """
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+            # requests follows redirects by default, so match it
+            follow_redirects=True,
+        )
+
+    @property
+    def headers(self) -> httpx.Headers:
+        """Headers sent with every request."""
+        return self._client.headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> HTTP2Response:
+        """
+        Send an HTTP request.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE, etc.)
+            url: Absolute request URL
+            params: Query parameters
+            data: Raw request body
+            headers: Extra headers for this request only
+            timeout: Request timeout in seconds
+            stream: Whether to defer downloading the response body
+
+        Returns:
+            HTTP2Response: The wrapped response
+
+        Raises:
+            requests.exceptions.ConnectionError: If unable to connect
+            requests.exceptions.Timeout: If the request times out
+        """
+        with _translate_errors():
+            request = self._client.build_request(
+                method,
+                url,
+                params=params,
+                content=data,
+                headers=headers,
+                timeout=timeout,
+            )
+            return HTTP2Response(self._client.send(request, stream=stream))
+
+    def get(self, url: str, **kwargs: Any) -> HTTP2Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def close(self) -> None:
+        """Close the underlying httpx client."""
+        self._client.close()
@@ -0,0 +1,377 @@
+"""
+Asynchronous client for the GoetGevonden API.
+
+This module provides an ``asyncio`` interface built on ``httpx.AsyncClient``.
+It mirrors the endpoint methods of
+:class:`~goetgevonden.client.GoetGevondenClient`, so independent requests can
+be issued concurrently over a shared HTTP/2 connection pool.
+Requires the optional ``async`` extra (``pip install goetgevonden[async]``).
+
+Example:
+    >>> import asyncio
+    >>> from goetgevonden import AsyncGoetGevondenClient
+    >>> async def main():
+    ...     async with AsyncGoetGevondenClient() as client:
+    ...         queries = ["Amsterdam", "Holland", "Zeeland"]
+    ...         return await asyncio.gather(*[client.search_text(q) for q in queries])
+    >>> results = asyncio.run(main())
+"""
+
+import asyncio
+from collections.abc import Iterable
+from types import TracebackType
+from typing import Any, cast
+
+import httpx
+
+from .client import (
+    _ABOUT_PATH,
+    _BODY_PATH,
+    _FILL_PATH,
+    _IDENTITY_ENCODING,
+    _INDEX_PATH,
+    _INDICES_PATH,
+    _PROJECT_PATH,
+    _PROJECTS_PATH,
+    _SEARCH_PATH,
+    _VIEWS_PATH,
+    GoetGevondenClient,
+    _annotation_params,
+    _fill_params,
+    _json_dumps,
+    _parse_response,
+    _search_request,
+)
+from .exceptions import ConnectionError, TimeoutError, ValidationError
+from .models import AboutInfo, IndexRange, SearchResult, SortOrder, ViewConfiguration
+
+
+class AsyncGoetGevondenClient:
+    """
+    Asynchronous client for interacting with the GoetGevonden API.
+
+    Each endpoint method is a coroutine with the same arguments and return type
+    as its counterpart on :class:`~goetgevonden.client.GoetGevondenClient`.
+    Responses are not cached, and the paginating and streaming helpers
+    (``search_pages``, ``search_iter``) are only available on the sync client.
+
+    Example:
+        >>> async with AsyncGoetGevondenClient() as client:
+        ...     results = await client.search_text("Amsterdam")
+        ...     print(f"Found {results.total} results")
+    """
+
+    DEFAULT_BASE_URL = GoetGevondenClient.DEFAULT_BASE_URL
+    DEFAULT_PROJECT = GoetGevondenClient.DEFAULT_PROJECT
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: int = 30,
+        client: httpx.AsyncClient | None = None,
+        max_connections: int = 64,
+        http2: bool = True,
+    ):
+        """
+        Initialize the asynchronous GoetGevonden client.
+
+        Args:
+            base_url: Base URL for the API. Defaults to https://api.goetgevonden.nl
+            timeout: Request timeout in seconds. Defaults to 30.
+            client: Optional httpx AsyncClient to use instead of creating one.
+            max_connections: Maximum number of concurrent connections when the
+                client creates its own AsyncClient. Defaults to 64.
+            http2: Whether to negotiate HTTP/2 when the client creates its own
+                AsyncClient. Defaults to True.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections // 2,
+                ),
+                http2=http2,
+                # requests follows redirects by default, so match the sync client
+                follow_redirects=True,
+            )
+        self._client = client
+        self._client.headers.update(
+            {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            }
+        )
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """
+        Make an HTTP request to the API.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE, etc.)
+            endpoint: API endpoint path
+            params: Query parameters
+            body: JSON-encoded request body, see ``_json_dumps``
+            headers: Extra headers for this request only
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            APIError: If the API returns an error response
+            ConnectionError: If unable to connect to the API
+            TimeoutError: If the request times out
+            NotFoundError: If the resource is not found
+        """
+        url = self.base_url + "/" + endpoint.lstrip("/")
+
+        try:
+            response = await self._client.request(
+                method,
+                url,
+                params=params,
+                content=body,
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"Request to {url} timed out") from e
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Failed to connect to {url}: {e}") from e
+
+        return _parse_response(response, endpoint)
+
+    # =========================================================================
+    # Server Information Endpoints
+    # =========================================================================
+
+    async def get_about(self) -> AboutInfo:
+        """Get basic server information."""
+        data = await self._request("GET", _ABOUT_PATH, headers=_IDENTITY_ENCODING)
+        return AboutInfo.from_dict(data)
+
+    async def get_home_page(self) -> str:
+        """Get the server homepage HTML."""
+        response = await self._client.get(self.base_url + "/", timeout=self.timeout)
+        return response.text
+
+    # =========================================================================
+    # Project Endpoints
+    # =========================================================================
+
+    async def list_projects(self) -> list[str]:
+        """Get list of configured projects."""
+        return cast(
+            list[str], await self._request("GET", _PROJECTS_PATH, headers=_IDENTITY_ENCODING)
+        )
+
+    async def get_project_body_types(self, project_id: str = DEFAULT_PROJECT) -> Any:
+        """Get distinct body types for a project."""
+        return await self._request("GET", _PROJECT_PATH % project_id)
+
+    async def get_views(self, project_id: str = DEFAULT_PROJECT) -> dict[str, ViewConfiguration]:
+        """Get view configurations for a project."""
+        data = await self._request("GET", _VIEWS_PATH % project_id)
+        return {key: ViewConfiguration.from_dict(value) for key, value in data.items()}
+
+    async def get_annotations(
+        self,
+        body_id: str,
+        project_id: str = DEFAULT_PROJECT,
+        include_results: str | None = None,
+        views: str | None = None,
+        overlap_types: str | None = None,
+        relative_to: str = "Origin",
+    ) -> dict[str, Any]:
+        """Get annotations for a specific body ID."""
+        params = _annotation_params(include_results, views, overlap_types, relative_to)
+        return cast(
+            dict[str, Any],
+            await self._request("GET", _BODY_PATH % (project_id, body_id), params=params),
+        )
+
+    async def get_annotations_bulk(
+        self,
+        body_ids: Iterable[str],
+        project_id: str = DEFAULT_PROJECT,
+        include_results: str | None = None,
+        views: str | None = None,
+        overlap_types: str | None = None,
+        relative_to: str = "Origin",
+        max_workers: int = 16,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get annotations for many body IDs concurrently.
+
+        At most ``max_workers`` requests are in flight at once, so large ID lists
+        do not queue on the connection pool until they time out.
+
+        Raises:
+            ValidationError: If max_workers is not positive
+        """
+        if max_workers <= 0:
+            raise ValidationError("'max_workers' must be positive")
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(body_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get_annotations(
+                    body_id,
+                    project_id,
+                    include_results,
+                    views,
+                    overlap_types,
+                    relative_to,
+                )
+
+        body_ids = list(dict.fromkeys(body_ids))
+        results = await asyncio.gather(*[fetch(body_id) for body_id in body_ids])
+        return dict(zip(body_ids, results, strict=True))
+
+    # =========================================================================
+    # Search Endpoints
+    # =========================================================================
+
+    async def search(
+        self,
+        project_id: str = DEFAULT_PROJECT,
+        text: str | None = None,
+        terms: dict[str, Any] | None = None,
+        date_range: IndexRange | None = None,
+        value_range: IndexRange | None = None,
+        aggregations: dict[str, dict[str, Any]] | None = None,
+        index_name: str | None = None,
+        from_: int = 0,
+        size: int = 10,
+        fragment_size: int = 100,
+        sort_by: str = "_score",
+        sort_order: SortOrder = SortOrder.DESC,
+        keep_raw: bool = False,
+    ) -> SearchResult:
+        """
+        Search the project index.
+
+        Raises:
+            ValidationError: If search parameters are invalid
+        """
+        params, body = _search_request(
+            text,
+            terms,
+            date_range,
+            value_range,
+            aggregations,
+            index_name,
+            from_,
+            size,
+            fragment_size,
+            sort_by,
+            sort_order,
+        )
+
+        data = await self._request(
+            "POST",
+            _SEARCH_PATH % project_id,
+            params=params,
+            body=_json_dumps(body),
+        )
+        return SearchResult.from_dict(data, keep_raw=keep_raw)
+
+    async def search_text(
+        self,
+        query: str,
+        project_id: str = DEFAULT_PROJECT,
+        from_: int = 0,
+        size: int = 10,
+    ) -> SearchResult:
+        """Convenience method for simple text search."""
+        return await self.search(
+            project_id=project_id,
+            text=query,
+            from_=from_,
+            size=size,
+        )
+
+    async def search_by_date(
+        self,
+        start_date: str,
+        end_date: str,
+        text: str | None = None,
+        date_field: str = "date",
+        project_id: str = DEFAULT_PROJECT,
+        from_: int = 0,
+        size: int = 10,
+    ) -> SearchResult:
+        """Search with a date range filter."""
+        date_range = IndexRange(name=date_field, from_value=start_date, to_value=end_date)
+        return await self.search(
+            project_id=project_id,
+            text=text,
+            date_range=date_range,
+            from_=from_,
+            size=size,
+        )
+
+    # =========================================================================
+    # Index Management Endpoints (Brinta)
+    # =========================================================================
+
+    async def get_indices(self, project_id: str = DEFAULT_PROJECT) -> Any:
+        """Get list of indices for a project."""
+        return await self._request("GET", _INDICES_PATH % project_id)
+
+    async def create_index(self, index_name: str, project_id: str = DEFAULT_PROJECT) -> Any:
+        """Create a new index."""
+        return await self._request("POST", _INDEX_PATH % (project_id, index_name))
+
+    async def delete_index(
+        self,
+        index_name: str,
+        project_id: str = DEFAULT_PROJECT,
+        delete_key: str | None = None,
+    ) -> Any:
+        """Delete an index."""
+        params = None if delete_key is None else {"deleteKey": delete_key}
+        return await self._request("DELETE", _INDEX_PATH % (project_id, index_name), params=params)
+
+    async def fill_index(
+        self,
+        index_name: str,
+        project_id: str = DEFAULT_PROJECT,
+        meta_anno: str | None = None,
+        meta_values: str | None = None,
+        take: int | None = None,
+    ) -> Any:
+        """Fill an index with data."""
+        params = _fill_params(meta_anno, meta_values, take)
+        return await self._request("POST", _FILL_PATH % (project_id, index_name), params=params)
+
+    # =========================================================================
+    # Context Manager Support
+    # =========================================================================
+
+    async def __aenter__(self) -> "AsyncGoetGevondenClient":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager and close the client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
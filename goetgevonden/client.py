@@ -6,10 +6,18 @@ which gives access to De resoluties van de Staten-Generaal (Resolutions
 of the States-General of the Dutch Republic).
 """
 
-from typing import Any
-from urllib.parse import urljoin
+import functools
+import inspect
+import math
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar, cast
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 
 from .exceptions import (
     APIError,
@@ -28,6 +36,236 @@ from .models import (
     ViewConfiguration,
 )
 
+if TYPE_CHECKING:
+    from ._http2 import HTTP2Response, HTTP2Session
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    # Stringify non-str dict keys like the stdlib encoder, e.g. {1650: ...} in terms
+    _json_dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json
+
+    _json_loads = json.loads  # type: ignore[assignment]
+
+    def _json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode()
+
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - ijson is only needed for search_iter
+    ijson = None
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Endpoint path templates, shared with the async client
+_ABOUT_PATH = "/about"
+_PROJECTS_PATH = "/projects"
+_PROJECT_PATH = "/projects/%s"
+_VIEWS_PATH = "/projects/%s/views"
+_BODY_PATH = "/projects/%s/%s"
+_SEARCH_PATH = "/projects/%s/search"
+_INDICES_PATH = "/brinta/%s/indices"
+_INDEX_PATH = "/brinta/%s/%s"
+_FILL_PATH = "/brinta/%s/%s/fill"
+
+_DEFAULT_ANNO_PARAMS = {"relativeTo": "Origin"}
+
+# Tiny responses (/about, /projects) cost more to decompress than to transfer
+_IDENTITY_ENCODING = {"Accept-Encoding": "identity"}
+
+
+def _parse_response(response: Any, endpoint: str) -> Any:
+    """
+    Translate an HTTP response into parsed JSON or raise the matching exception.
+
+    Only ``status_code``, ``content`` and ``text`` are used, so both
+    ``requests`` and ``httpx`` responses are accepted.
+
+    Args:
+        response: The HTTP response object
+        endpoint: API endpoint path, used in error messages
+
+    Returns:
+        Parsed JSON response, the response text if it is not JSON, or None
+        for empty responses
+
+    Raises:
+        APIError: If the API returns an error response
+        NotFoundError: If the resource is not found
+    """
+    if response.status_code == 404:
+        raise NotFoundError(f"Resource not found: {endpoint}")
+
+    if response.status_code >= 400:
+        try:
+            error_data = _json_loads(response.content)
+        except ValueError:
+            error_data = {"message": response.text}
+        raise APIError(
+            f"API error: {response.status_code}",
+            status_code=response.status_code,
+            response=error_data,
+        )
+
+    if response.status_code == 204 or not response.content:
+        return None
+
+    # Parse the raw bytes directly; orjson.JSONDecodeError subclasses ValueError.
+    try:
+        return _json_loads(response.content)
+    except ValueError:
+        return response.text
+
+
+def _annotation_params(
+    include_results: str | None,
+    views: str | None,
+    overlap_types: str | None,
+    relative_to: str,
+) -> dict[str, str]:
+    """Build the query parameters for an annotations request."""
+    if (
+        include_results is None
+        and views is None
+        and overlap_types is None
+        and relative_to == "Origin"
+    ):
+        # Shared across calls; neither requests nor httpx mutate params
+        return _DEFAULT_ANNO_PARAMS
+
+    params = {"relativeTo": relative_to}
+    if include_results is not None:
+        params["includeResults"] = include_results
+    if views is not None:
+        params["views"] = views
+    if overlap_types is not None:
+        params["overlapTypes"] = overlap_types
+    return params
+
+
+def _fill_params(
+    meta_anno: str | None,
+    meta_values: str | None,
+    take: int | None,
+) -> dict[str, Any] | None:
+    """Build the query parameters for a fill-index request, or None if there are none."""
+    if meta_anno is None and meta_values is None and take is None:
+        return None
+
+    params: dict[str, Any] = {}
+    if meta_anno is not None:
+        params["metaAnno"] = meta_anno
+    if meta_values is not None:
+        params["metaValues"] = meta_values
+    if take is not None:
+        params["take"] = take
+    return params
+
+
+def _search_request(
+    text: str | None,
+    terms: dict[str, Any] | None,
+    date_range: IndexRange | None,
+    value_range: IndexRange | None,
+    aggregations: dict[str, dict[str, Any]] | None,
+    index_name: str | None,
+    from_: int,
+    size: int,
+    fragment_size: int,
+    sort_by: str,
+    sort_order: SortOrder,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Validate search arguments and build the query parameters and JSON body.
+
+    Returns:
+        tuple: Query parameters and the request body
+
+    Raises:
+        ValidationError: If search parameters are invalid
+    """
+    if from_ < 0:
+        raise ValidationError("'from_' must be non-negative")
+    if size < 0:
+        raise ValidationError("'size' must be non-negative")
+
+    query = IndexQuery(
+        text=text,
+        terms=terms,
+        date=date_range,
+        range=value_range,
+        aggs=aggregations,
+    )
+
+    params: dict[str, Any] = {
+        "from": from_,
+        "size": size,
+        "fragmentSize": fragment_size,
+        "sortBy": sort_by,
+        "sortOrder": sort_order.value,
+    }
+    if index_name is not None:
+        params["indexName"] = index_name
+
+    body = query.to_dict()
+    # orjson writes NaN/Infinity as null and the stdlib refuses them, so reject
+    # them up front for the same behaviour with either encoder
+    if _has_non_finite(body):
+        raise ValidationError("Search values must be finite numbers")
+
+    return params, body
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Return whether a JSON-like value contains a NaN or infinite float."""
+    if type(value) is float:
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, list | tuple):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+def _ttl_cached(
+    method: Callable[Concatenate["GoetGevondenClient", _P], _T],
+) -> Callable[Concatenate["GoetGevondenClient", _P], _T]:
+    """
+    Cache the result of a read-only client method for ``cache_ttl`` seconds.
+
+    Results are stored on the client instance, keyed on the method name and
+    its arguments with defaults applied, so positional, keyword and omitted
+    arguments share one entry. Caching is skipped when ``cache_ttl`` is 0.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "GoetGevondenClient", *args: _P.args, **kwargs: _P.kwargs) -> _T:
+        if self.cache_ttl <= 0:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__, bound.args[1:], frozenset(bound.kwargs.items()))
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > now:
+            return cast(_T, entry[1])
+
+        value = method(self, *args, **kwargs)
+        self._cache[key] = (now + self.cache_ttl, value)
+        return value
+
+    return wrapper
+
 
 class GoetGevondenClient:
     """
@@ -54,6 +292,9 @@ class GoetGevondenClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: int = 30,
         session: requests.Session | None = None,
+        pool_maxsize: int = 32,
+        cache_ttl: float = 300,
+        http2: bool = False,
     ):
         """
         Initialize the GoetGevonden client.
@@ -61,11 +302,54 @@ class GoetGevondenClient:
         Args:
             base_url: Base URL for the API. Defaults to https://api.goetgevonden.nl
             timeout: Request timeout in seconds. Defaults to 30.
-            session: Optional requests Session for connection pooling.
+            session: Optional requests Session for connection pooling. A supplied
+                session keeps its own transport adapters.
+            pool_maxsize: Maximum number of pooled keep-alive connections when the
+                client creates its own session. Defaults to 32.
+            cache_ttl: Seconds to cache the results of the read-only server and
+                project endpoints. Cached results are shared between calls, so
+                treat them as read-only. Set to 0 to disable caching. Defaults to 300.
+            http2: Send requests over HTTP/2 using httpx instead of requests, so
+                concurrent calls share one multiplexed connection. Requires the
+                ``async`` extra and cannot be combined with ``session``.
+                Transient errors are not retried in this mode. Defaults to False.
+
+        Raises:
+            ValidationError: If both ``session`` and ``http2`` are given
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self._session = session or requests.Session()
+        self.cache_ttl = cache_ttl
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        self._session: requests.Session | HTTP2Session
+        if http2:
+            if session is not None:
+                raise ValidationError("'session' cannot be combined with http2=True")
+            from . import _http2
+
+            self._session = _http2.HTTP2Session(max_connections=pool_maxsize)
+        else:
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=pool_maxsize,
+                    pool_maxsize=pool_maxsize,
+                    # read=False: a read timeout surfaces as TimeoutError and
+                    # never replays a request the server may already be handling
+                    max_retries=Retry(
+                        total=3,
+                        read=False,
+                        backoff_factor=0.3,
+                        status_forcelist=(429, 502, 503, 504),
+                        allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+                        raise_on_status=False,
+                    ),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+            # Only sent over HTTP/1.1; HTTP/2 forbids connection-specific headers
+            session.headers["Connection"] = "keep-alive"
+            self._session = session
         self._session.headers.update(
             {
                 "Accept": "application/json",
@@ -78,7 +362,8 @@ class GoetGevondenClient:
         method: str,
         endpoint: str,
         params: dict | None = None,
-        json: dict | None = None,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
     ) -> Any:
         """
         Make an HTTP request to the API.
@@ -87,7 +372,8 @@ class GoetGevondenClient:
             method: HTTP method (GET, POST, DELETE, etc.)
             endpoint: API endpoint path
             params: Query parameters
-            json: JSON body for POST requests
+            body: JSON-encoded request body, see ``_json_dumps``
+            headers: Extra headers for this request only
 
         Returns:
             Parsed JSON response
@@ -98,47 +384,50 @@ class GoetGevondenClient:
             TimeoutError: If the request times out
             NotFoundError: If the resource is not found
         """
-        url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        response = self._send(method, endpoint, params=params, body=body, headers=headers)
+        return _parse_response(response, endpoint)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> "requests.Response | HTTP2Response":
+        """
+        Send an HTTP request and return the unparsed response.
+
+        Takes the same arguments as :meth:`_request`, plus ``stream`` to defer
+        downloading the response body.
+
+        Raises:
+            ConnectionError: If unable to connect to the API
+            TimeoutError: If the request times out
+        """
+        url = self.base_url + "/" + endpoint.lstrip("/")
 
         try:
-            response = self._session.request(
+            return self._session.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json,
+                data=body,
+                headers=headers,
                 timeout=self.timeout,
+                stream=stream,
             )
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Failed to connect to {url}: {e}") from e
         except requests.exceptions.Timeout as e:
             raise TimeoutError(f"Request to {url} timed out") from e
 
-        if response.status_code == 404:
-            raise NotFoundError(f"Resource not found: {endpoint}")
-
-        if not response.ok:
-            try:
-                error_data = response.json()
-            except ValueError:
-                error_data = {"message": response.text}
-            raise APIError(
-                f"API error: {response.status_code}",
-                status_code=response.status_code,
-                response=error_data,
-            )
-
-        if response.status_code == 204 or not response.content:
-            return None
-
-        try:
-            return response.json()
-        except ValueError:
-            return response.text
-
     # =========================================================================
     # Server Information Endpoints
     # =========================================================================
 
+    @_ttl_cached
     def get_about(self) -> AboutInfo:
         """
         Get basic server information.
@@ -151,7 +440,7 @@ class GoetGevondenClient:
             >>> info = client.get_about()
             >>> print(f"Server version: {info.version}")
         """
-        data = self._request("GET", "/about")
+        data = self._request("GET", _ABOUT_PATH, headers=_IDENTITY_ENCODING)
         return AboutInfo.from_dict(data)
 
     def get_home_page(self) -> str:
@@ -161,7 +450,7 @@ class GoetGevondenClient:
         Returns:
             str: HTML content of the homepage
         """
-        url = urljoin(self.base_url + "/", "/")
+        url = self.base_url + "/"
         response = self._session.get(url, timeout=self.timeout)
         return response.text
 
@@ -169,6 +458,7 @@ class GoetGevondenClient:
     # Project Endpoints
     # =========================================================================
 
+    @_ttl_cached
     def list_projects(self) -> list[str]:
         """
         Get list of configured projects.
@@ -182,8 +472,9 @@ class GoetGevondenClient:
             >>> print(projects)
             ['republic']
         """
-        return self._request("GET", "/projects")
+        return self._request("GET", _PROJECTS_PATH, headers=_IDENTITY_ENCODING)
 
+    @_ttl_cached
     def get_project_body_types(self, project_id: str = DEFAULT_PROJECT) -> Any:
         """
         Get distinct body types for a project.
@@ -198,8 +489,9 @@ class GoetGevondenClient:
             >>> client = GoetGevondenClient()
             >>> body_types = client.get_project_body_types("republic")
         """
-        return self._request("GET", f"/projects/{project_id}")
+        return self._request("GET", _PROJECT_PATH % project_id)
 
+    @_ttl_cached
     def get_views(self, project_id: str = DEFAULT_PROJECT) -> dict[str, ViewConfiguration]:
         """
         Get view configurations for a project.
@@ -216,7 +508,7 @@ class GoetGevondenClient:
             >>> for name, config in views.items():
             ...     print(f"{name}: {config.scope}")
         """
-        data = self._request("GET", f"/projects/{project_id}/views")
+        data = self._request("GET", _VIEWS_PATH % project_id)
         return {key: ViewConfiguration.from_dict(value) for key, value in data.items()}
 
     def get_annotations(
@@ -246,15 +538,66 @@ class GoetGevondenClient:
             >>> client = GoetGevondenClient()
             >>> annotations = client.get_annotations("some-body-id", "republic")
         """
-        params = {"relativeTo": relative_to}
-        if include_results is not None:
-            params["includeResults"] = include_results
-        if views is not None:
-            params["views"] = views
-        if overlap_types is not None:
-            params["overlapTypes"] = overlap_types
+        params = _annotation_params(include_results, views, overlap_types, relative_to)
+        return self._request("GET", _BODY_PATH % (project_id, body_id), params=params)
+
+    def get_annotations_bulk(
+        self,
+        body_ids: Iterable[str],
+        project_id: str = DEFAULT_PROJECT,
+        include_results: str | None = None,
+        views: str | None = None,
+        overlap_types: str | None = None,
+        relative_to: str = "Origin",
+        max_workers: int = 16,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get annotations for many body IDs concurrently.
+
+        Requests are issued from a thread pool over the client's shared session.
+        Keep ``max_workers`` at or below the client's ``pool_maxsize`` so every
+        worker gets a pooled connection. Duplicate IDs are fetched once.
+
+        Args:
+            body_ids: The body identifiers to retrieve annotations for
+            project_id: Project identifier. Defaults to 'republic'.
+            include_results: Optional filter for included results
+            views: Optional view filter
+            overlap_types: Optional overlap types filter
+            relative_to: Reference point for annotations. Defaults to 'Origin'.
+            max_workers: Maximum number of concurrent requests. Defaults to 16.
+
+        Returns:
+            dict: Mapping of body IDs to their annotation data
 
-        return self._request("GET", f"/projects/{project_id}/{body_id}", params=params)
+        Raises:
+            ValidationError: If max_workers is not positive
+
+        Example:
+            >>> client = GoetGevondenClient()
+            >>> annotations = client.get_annotations_bulk(["body-1", "body-2"])
+            >>> annotations["body-1"]
+        """
+        if max_workers <= 0:
+            raise ValidationError("'max_workers' must be positive")
+
+        body_ids = list(dict.fromkeys(body_ids))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(body_ids) or 1)) as executor:
+            futures = [
+                executor.submit(
+                    self.get_annotations,
+                    body_id,
+                    project_id,
+                    include_results,
+                    views,
+                    overlap_types,
+                    relative_to,
+                )
+                for body_id in body_ids
+            ]
+            return {
+                body_id: future.result() for body_id, future in zip(body_ids, futures, strict=True)
+            }
 
     # =========================================================================
     # Search Endpoints
@@ -274,6 +617,7 @@ class GoetGevondenClient:
         fragment_size: int = 100,
         sort_by: str = "_score",
         sort_order: SortOrder = SortOrder.DESC,
+        keep_raw: bool = False,
     ) -> SearchResult:
         """
         Search the project index.
@@ -291,6 +635,8 @@ class GoetGevondenClient:
             fragment_size: Size of text fragments in highlights. Defaults to 100.
             sort_by: Field to sort by. Defaults to '_score'.
             sort_order: Sort direction. Defaults to DESC.
+            keep_raw: Whether to keep the full parsed response in
+                ``SearchResult.raw_response``. Defaults to False.
 
         Returns:
             SearchResult: Search results including hits and aggregations
@@ -312,36 +658,184 @@ class GoetGevondenClient:
             >>> # Paginated search
             >>> results = client.search(text="Holland", from_=20, size=10)
         """
-        if from_ < 0:
-            raise ValidationError("'from_' must be non-negative")
-        if size < 0:
-            raise ValidationError("'size' must be non-negative")
-
-        query = IndexQuery(
-            text=text,
-            terms=terms,
-            date=date_range,
-            range=value_range,
-            aggs=aggregations,
+        params, body = _search_request(
+            text,
+            terms,
+            date_range,
+            value_range,
+            aggregations,
+            index_name,
+            from_,
+            size,
+            fragment_size,
+            sort_by,
+            sort_order,
         )
 
-        params = {
-            "from": from_,
-            "size": size,
-            "fragmentSize": fragment_size,
-            "sortBy": sort_by,
-            "sortOrder": sort_order.value,
-        }
-        if index_name is not None:
-            params["indexName"] = index_name
-
         data = self._request(
             "POST",
-            f"/projects/{project_id}/search",
+            _SEARCH_PATH % project_id,
             params=params,
-            json=query.to_dict(),
+            body=_json_dumps(body),
+        )
+        return SearchResult.from_dict(data, keep_raw=keep_raw)
+
+    def search_pages(
+        self,
+        project_id: str = DEFAULT_PROJECT,
+        text: str | None = None,
+        terms: dict[str, Any] | None = None,
+        date_range: IndexRange | None = None,
+        value_range: IndexRange | None = None,
+        aggregations: dict[str, dict[str, Any]] | None = None,
+        index_name: str | None = None,
+        from_: int = 0,
+        size: int = 10,
+        fragment_size: int = 100,
+        sort_by: str = "_score",
+        sort_order: SortOrder = SortOrder.DESC,
+        keep_raw: bool = False,
+    ) -> Iterator[SearchResult]:
+        """
+        Iterate over consecutive pages of search results.
+
+        Takes the same arguments as :meth:`search` and yields one SearchResult
+        per page of ``size`` hits, starting at ``from_``, until all hits have
+        been fetched. The request body is encoded only once for all pages.
+
+        Yields:
+            SearchResult: One page of search results
+
+        Raises:
+            ValidationError: If search parameters are invalid
+
+        Example:
+            >>> client = GoetGevondenClient()
+            >>> for page in client.search_pages(text="Amsterdam", size=100):
+            ...     for hit in page.hits:
+            ...         print(hit.get("_id"))
+        """
+        if size <= 0:
+            raise ValidationError("'size' must be positive when paginating")
+
+        params, body = _search_request(
+            text,
+            terms,
+            date_range,
+            value_range,
+            aggregations,
+            index_name,
+            from_,
+            size,
+            fragment_size,
+            sort_by,
+            sort_order,
         )
-        return SearchResult.from_dict(data)
+        return self._search_paginated(
+            _SEARCH_PATH % project_id, _json_dumps(body), params, keep_raw
+        )
+
+    def search_iter(
+        self,
+        project_id: str = DEFAULT_PROJECT,
+        text: str | None = None,
+        terms: dict[str, Any] | None = None,
+        date_range: IndexRange | None = None,
+        value_range: IndexRange | None = None,
+        aggregations: dict[str, dict[str, Any]] | None = None,
+        index_name: str | None = None,
+        from_: int = 0,
+        size: int = 10,
+        fragment_size: int = 100,
+        sort_by: str = "_score",
+        sort_order: SortOrder = SortOrder.DESC,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream the hits of a search without buffering the whole response.
+
+        Takes the same arguments as :meth:`search`. The response is parsed
+        incrementally with ijson, so memory use stays flat for large ``size``
+        values. Unlike :meth:`search`, hits are yielded as raw dictionaries
+        rather than wrapped in a SearchResult, and only the Broccoli response
+        format (top-level ``results``) is supported.
+
+        Requires the optional ``stream`` extra (``pip install goetgevonden[stream]``).
+
+        Yields:
+            dict: One search hit
+
+        Raises:
+            ImportError: If ijson is not installed
+            ValidationError: If search parameters are invalid
+
+        Example:
+            >>> client = GoetGevondenClient()
+            >>> for hit in client.search_iter(text="Amsterdam", size=10000):
+            ...     print(hit.get("_id"))
+        """
+        if ijson is None:
+            raise ImportError("search_iter requires ijson: pip install goetgevonden[stream]")
+
+        params, body = _search_request(
+            text,
+            terms,
+            date_range,
+            value_range,
+            aggregations,
+            index_name,
+            from_,
+            size,
+            fragment_size,
+            sort_by,
+            sort_order,
+        )
+        return self._stream_hits(_SEARCH_PATH % project_id, params, _json_dumps(body))
+
+    def _stream_hits(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        body: bytes,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the ``results`` items of a streamed search response as they are parsed."""
+        with self._send("POST", endpoint, params=params, body=body, stream=True) as response:
+            try:
+                if response.status_code >= 400:
+                    _parse_response(response, endpoint)
+
+                hits = ijson.sendable_list()
+                parser = ijson.items_coro(hits, "results.item", use_float=True)
+                for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                    parser.send(chunk)
+                    yield from hits
+                    del hits[:]
+                parser.close()
+                yield from hits
+            except requests.exceptions.RequestException as e:
+                # _send only covers sending the request; the body can still fail
+                # mid-stream, where requests reports read timeouts as ConnectionError
+                url = self.base_url + "/" + endpoint.lstrip("/")
+                read_timeout = bool(e.args) and isinstance(e.args[0], ReadTimeoutError)
+                if read_timeout or isinstance(e, requests.exceptions.Timeout):
+                    raise TimeoutError(f"Request to {url} timed out") from e
+                raise ConnectionError(f"Connection to {url} failed: {e}") from e
+
+    def _search_paginated(
+        self,
+        endpoint: str,
+        body: bytes,
+        params: dict[str, Any],
+        keep_raw: bool = False,
+    ) -> Iterator[SearchResult]:
+        """Yield search pages, advancing only the ``from`` parameter between requests."""
+        params = dict(params)
+        while True:
+            data = self._request("POST", endpoint, params=params, body=body)
+            result = SearchResult.from_dict(data, keep_raw=keep_raw)
+            yield result
+            params["from"] += params["size"]
+            if not result.hits or params["from"] >= result.total:
+                return
 
     def search_text(
         self,
@@ -431,7 +925,7 @@ class GoetGevondenClient:
             >>> client = GoetGevondenClient()
             >>> indices = client.get_indices("republic")
         """
-        return self._request("GET", f"/brinta/{project_id}/indices")
+        return self._request("GET", _INDICES_PATH % project_id)
 
     def create_index(self, index_name: str, project_id: str = DEFAULT_PROJECT) -> Any:
         """
@@ -446,7 +940,7 @@ class GoetGevondenClient:
         Returns:
             Index creation response
         """
-        return self._request("POST", f"/brinta/{project_id}/{index_name}")
+        return self._request("POST", _INDEX_PATH % (project_id, index_name))
 
     def delete_index(
         self,
@@ -467,15 +961,8 @@ class GoetGevondenClient:
         Returns:
             Index deletion response
         """
-        params = {}
-        if delete_key is not None:
-            params["deleteKey"] = delete_key
-
-        return self._request(
-            "DELETE",
-            f"/brinta/{project_id}/{index_name}",
-            params=params if params else None,
-        )
+        params = None if delete_key is None else {"deleteKey": delete_key}
+        return self._request("DELETE", _INDEX_PATH % (project_id, index_name), params=params)
 
     def fill_index(
         self,
@@ -500,19 +987,8 @@ class GoetGevondenClient:
         Returns:
             Index fill response
         """
-        params = {}
-        if meta_anno is not None:
-            params["metaAnno"] = meta_anno
-        if meta_values is not None:
-            params["metaValues"] = meta_values
-        if take is not None:
-            params["take"] = take
-
-        return self._request(
-            "POST",
-            f"/brinta/{project_id}/{index_name}/fill",
-            params=params if params else None,
-        )
+        params = _fill_params(meta_anno, meta_values, take)
+        return self._request("POST", _FILL_PATH % (project_id, index_name), params=params)
 
     # =========================================================================
     # Context Manager Support
@@ -526,6 +1002,10 @@ class GoetGevondenClient:
         """Exit context manager and close session."""
         self.close()
 
+    def invalidate_cache(self) -> None:
+        """Discard all cached endpoint results."""
+        self._cache.clear()
+
     def close(self) -> None:
         """Close the HTTP session."""
         self._session.close()
@@ -2,8 +2,10 @@
 Data models for the GoetGevonden API wrapper.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import itemgetter
 from typing import Any
 
 
@@ -21,7 +23,11 @@ class ViewScope(str, Enum):
     WITHIN = "WITHIN"
 
 
-@dataclass
+# Plain dict lookup avoids the EnumMeta.__call__ path for every parsed view
+_SCOPE_BY_STR = {scope.value: scope for scope in ViewScope}
+
+
+@dataclass(slots=True)
 class AboutInfo:
     """Server information returned by the /about endpoint."""
 
@@ -43,7 +49,32 @@ class AboutInfo:
         )
 
 
-@dataclass
+# Low-cardinality keyword fields whose values repeat across many search hits.
+# JSON parsers already share repeated keys within a response, but not values.
+_INTERNED_FIELDS = ("textType", "resolutionType", "propositionType", "sessionWeekday", "bodyType")
+
+
+def _intern_values(hits: list[Any]) -> None:
+    """Intern the string values of known keyword fields in place."""
+    intern = sys.intern
+    for hit in hits:
+        # Hits are passed through as-is, so skip anything that is not a document
+        if type(hit) is not dict:
+            continue
+        source = hit.get("_source")
+        if type(source) is not dict:
+            source = hit
+        for key in _INTERNED_FIELDS:
+            value = source.get(key)
+            if type(value) is str:
+                source[key] = intern(value)
+
+
+# Fast path for the common case where both keys are present
+_get_path_value = itemgetter("path", "value")
+
+
+@dataclass(slots=True)
 class ViewAnnoConstraint:
     """Annotation constraint for view configurations."""
 
@@ -53,13 +84,16 @@ class ViewAnnoConstraint:
     @classmethod
     def from_dict(cls, data: dict) -> "ViewAnnoConstraint":
         """Create a ViewAnnoConstraint instance from API response data."""
-        return cls(
-            path=data.get("path", ""),
-            value=data.get("value", ""),
-        )
+        try:
+            return cls(*_get_path_value(data))
+        except KeyError:
+            return cls(
+                path=data.get("path", ""),
+                value=data.get("value", ""),
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class ViewConfiguration:
     """View configuration for a project."""
 
@@ -69,13 +103,15 @@ class ViewConfiguration:
     @classmethod
     def from_dict(cls, data: dict) -> "ViewConfiguration":
         """Create a ViewConfiguration instance from API response data."""
+        constraint_from_dict = ViewAnnoConstraint.from_dict
+        scope = data.get("scope", "OVERLAP")
         return cls(
-            anno=[ViewAnnoConstraint.from_dict(a) for a in data.get("anno", [])],
-            scope=ViewScope(data.get("scope", "OVERLAP")),
+            anno=[constraint_from_dict(a) for a in data.get("anno", ())],
+            scope=_SCOPE_BY_STR.get(scope) or ViewScope(scope),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexRange:
     """Range specification for index queries."""
 
@@ -86,14 +122,16 @@ class IndexRange:
     def to_dict(self) -> dict:
         """Convert to dictionary for API request."""
         result = {"name": self.name}
-        if self.from_value is not None:
-            result["from"] = self.from_value
-        if self.to_value is not None:
-            result["to"] = self.to_value
+        from_value = self.from_value
+        if from_value is not None:
+            result["from"] = from_value
+        to_value = self.to_value
+        if to_value is not None:
+            result["to"] = to_value
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexQuery:
     """Query parameters for searching an index."""
 
@@ -105,46 +143,71 @@ class IndexQuery:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for API request."""
-        result = {}
-        if self.text is not None:
-            result["text"] = self.text
-        if self.terms is not None:
-            result["terms"] = self.terms
-        if self.date is not None:
-            result["date"] = self.date.to_dict()
-        if self.range is not None:
-            result["range"] = self.range.to_dict()
-        if self.aggs is not None:
-            result["aggs"] = self.aggs
+        # Bind each field to a local so every slot is read only once
+        result: dict[str, Any] = {}
+        text = self.text
+        if text is not None:
+            result["text"] = text
+        terms = self.terms
+        if terms is not None:
+            result["terms"] = terms
+        date = self.date
+        if date is not None:
+            result["date"] = date.to_dict()
+        range_ = self.range
+        if range_ is not None:
+            result["range"] = range_.to_dict()
+        aggs = self.aggs
+        if aggs is not None:
+            result["aggs"] = aggs
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
-    """Search result from the API."""
+    """Search result from the API.
+
+    ``meta`` holds the response envelope without the hit list. ``raw_response``
+    holds the full parsed response only when requested with ``keep_raw=True``;
+    otherwise it is empty so the envelope can be garbage collected. String
+    values of keyword fields such as ``textType`` and ``resolutionType`` are
+    interned, so identical values across hits share a single object.
+    """
 
     total: int
     hits: list[dict[str, Any]]
     aggregations: dict[str, Any] | None = None
     raw_response: dict = field(default_factory=dict)
+    meta: dict[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "SearchResult":
+    def from_dict(cls, data: dict, keep_raw: bool = False) -> "SearchResult":
         """Create a SearchResult instance from API response data.
 
         Handles both Elasticsearch-style responses (with nested hits.hits)
         and the Broccoli API format (with top-level results and total).
+
+        Args:
+            data: Parsed API response
+            keep_raw: Whether to keep the full response in ``raw_response``.
+                Defaults to False.
         """
+        meta = {k: v for k, v in data.items() if k not in ("results", "hits")}
+        raw_response = data if keep_raw else {}
+
         # Try Broccoli API format first (top-level total and results)
         if "results" in data:
             total = data.get("total", 0)
             if isinstance(total, dict):
                 total = total.get("value", 0)
+            hits = data.get("results", [])
+            _intern_values(hits)
             return cls(
                 total=total,
-                hits=data.get("results", []),
+                hits=hits,
                 aggregations=data.get("aggs"),
-                raw_response=data,
+                raw_response=raw_response,
+                meta=meta,
             )
 
         # Fall back to Elasticsearch-style format
@@ -153,15 +216,18 @@ class SearchResult:
         if isinstance(total, dict):
             total = total.get("value", 0)
 
+        hits = hits_data.get("hits", [])
+        _intern_values(hits)
         return cls(
             total=total,
-            hits=hits_data.get("hits", []),
+            hits=hits,
             aggregations=data.get("aggregations"),
-            raw_response=data,
+            raw_response=raw_response,
+            meta=meta,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Annotation:
     """Annotation data from the API."""
 
@@ -0,0 +1,31 @@
+"""Shared fixtures for the GoetGevonden test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def session_client():
+    """Create a single client, and its connection pool, for the whole test session."""
+    # Imported here so model-only test runs never load the client module
+    from goetgevonden import GoetGevondenClient
+
+    client = GoetGevondenClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def client(session_client):
+    """Hand out the shared client with its endpoint cache cleared."""
+    session_client.invalidate_cache()
+    return session_client
+
+
+@pytest.fixture
+def mocked_responses():
+    """Route a test's requests traffic through one responses mock."""
+    # Imported here for the same reason: responses pulls in requests
+    import responses
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
@@ -0,0 +1,155 @@
+"""Tests for the asynchronous GoetGevonden client."""
+
+import asyncio
+import functools
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from goetgevonden import (  # noqa: E402
+    APIError,
+    AsyncGoetGevondenClient,
+    ConnectionError,
+    SearchResult,
+    ValidationError,
+)
+
+
+def make_client(handler):
+    """Create an async client whose requests are answered by ``handler``."""
+    return AsyncGoetGevondenClient(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+class TestAsyncGoetGevondenClient:
+    """Test suite for AsyncGoetGevondenClient."""
+
+    def test_exported_from_package(self):
+        """Test that star imports include the async client when httpx is installed."""
+        import goetgevonden
+
+        assert "AsyncGoetGevondenClient" in goetgevonden.__all__
+
+    def test_list_projects(self):
+        """Test listing available projects."""
+
+        def handler(request):
+            assert request.url == "https://api.goetgevonden.nl/projects"
+            return httpx.Response(200, json=["republic"])
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.list_projects()
+
+        assert asyncio.run(run()) == ["republic"]
+
+    def test_concurrent_searches(self):
+        """Test fanning out several searches with asyncio.gather."""
+
+        def handler(request):
+            body = json.loads(request.content)
+            assert request.url.params["from"] == "0"
+            return httpx.Response(
+                200,
+                json={
+                    "total": {"value": len(body["text"]), "relation": "eq"},
+                    "results": [{"_id": body["text"]}],
+                    "aggs": {},
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await asyncio.gather(
+                    client.search_text("Amsterdam"),
+                    client.search_text("Holland"),
+                )
+
+        amsterdam, holland = asyncio.run(run())
+
+        assert isinstance(amsterdam, SearchResult)
+        assert amsterdam.total == len("Amsterdam")
+        assert holland.hits == [{"_id": "Holland"}]
+
+    def test_get_annotations_bulk(self):
+        """Test that bulk lookups respect max_workers and map IDs to annotations."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"bodyId": request.url.path.rsplit("/", 1)[-1]})
+
+        body_ids = [f"body-{i}" for i in range(10)]
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get_annotations_bulk(body_ids + body_ids[:3], max_workers=3)
+
+        annotations = asyncio.run(run())
+
+        assert annotations == {body_id: {"bodyId": body_id} for body_id in body_ids}
+        assert peak == 3
+
+    def test_get_annotations_bulk_rejects_non_positive_workers(self):
+        """Test that max_workers must be positive."""
+
+        async def run():
+            async with make_client(lambda request: httpx.Response(200, json={})) as client:
+                await client.get_annotations_bulk(["a"], max_workers=0)
+
+        with pytest.raises(ValidationError):
+            asyncio.run(run())
+
+    def test_follows_redirects(self, monkeypatch):
+        """Test that the client's own AsyncClient follows redirects like requests does."""
+
+        def handler(request):
+            if request.url.path == "/":
+                return httpx.Response(301, headers={"Location": "https://api.goetgevonden.nl/home"})
+            return httpx.Response(200, text="<html>GoetGevonden</html>")
+
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+        )
+
+        async def run():
+            async with AsyncGoetGevondenClient() as client:
+                return await client.get_home_page()
+
+        assert asyncio.run(run()) == "<html>GoetGevonden</html>"
+
+    def test_api_error(self):
+        """Test API error response handling."""
+
+        def handler(request):
+            return httpx.Response(500, json={"error": "Internal server error"})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.list_projects()
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(run())
+
+        assert exc_info.value.status_code == 500
+
+    def test_connection_error(self):
+        """Test that transport failures are translated to ConnectionError."""
+
+        def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.get_about()
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(run())
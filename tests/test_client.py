@@ -1,39 +1,85 @@
 """Tests for the GoetGevonden client."""
 
+import functools
+import json
+import socket
+import threading
+
 import pytest
+import requests
 import responses
+from urllib3.exceptions import ReadTimeoutError
 
 from goetgevonden import (
-    GoetGevondenClient,
+    AboutInfo,
     APIError,
     ConnectionError,
+    GoetGevondenClient,
+    IndexRange,
     NotFoundError,
     SearchResult,
-    AboutInfo,
-    IndexRange,
     SortOrder,
+    TimeoutError,
+    ValidationError,
 )
 
+# Every client test runs inside the responses mock, even if it registers nothing
+pytestmark = pytest.mark.usefixtures("mocked_responses")
+
+BASE_URL = "https://api.goetgevonden.nl"
+PROJECTS_URL = f"{BASE_URL}/projects"
+SEARCH_URL = f"{PROJECTS_URL}/republic/search"
+
+# (id, client method, args, kwargs, total, expected query fragments, expected body)
+SEARCH_CASES = [
+    ("text", "search_text", ("Amsterdam",), {}, 100, ["from=0", "size=10"], {"text": "Amsterdam"}),
+    (
+        "date",
+        "search_by_date",
+        ("1600", "1650"),
+        {"text": "oorlog"},
+        50,
+        [],
+        {"text": "oorlog", "date": {"name": "date", "from": "1600", "to": "1650"}},
+    ),
+    ("paginate", "search", (), {"from_": 20, "size": 10}, 1000, ["from=20", "size=10"], {}),
+    ("int-key", "search", (), {"terms": {1650: "x"}}, 1, [], {"terms": {"1650": "x"}}),
+]
+
+
+def _search_body(total, hits=()):
+    """Build a Broccoli-style search response with ``total`` matches."""
+    return {"total": {"value": total, "relation": "eq"}, "results": list(hits), "aggs": {}}
+
+
+def _add_search_response(mocked_responses, total, hits=()):
+    """Register a search response with ``total`` matches."""
+    mocked_responses.add(responses.POST, SEARCH_URL, json=_search_body(total, hits), status=200)
+
+
+def _http2_client(monkeypatch, transport):
+    """Create an HTTP/2 client whose requests are answered by an httpx ``transport``."""
+    from goetgevonden import _http2
+
+    monkeypatch.setattr(
+        _http2, "HTTP2Session", functools.partial(_http2.HTTP2Session, transport=transport)
+    )
+    return GoetGevondenClient(http2=True)
+
 
 class TestGoetGevondenClient:
     """Test suite for GoetGevondenClient."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a client instance for testing."""
-        return GoetGevondenClient()
-
-    @responses.activate
-    def test_get_about(self, client):
+    def test_get_about(self, client, mocked_responses):
         """Test getting server information."""
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://api.goetgevonden.nl/about",
+            f"{BASE_URL}/about",
             json={
                 "appName": "Broccoli",
                 "version": "0.40.2",
                 "startedAt": "2024-01-01T00:00:00Z",
-                "baseURI": "https://api.goetgevonden.nl",
+                "baseURI": BASE_URL,
                 "hucLogLevel": "INFO",
             },
             status=200,
@@ -44,13 +90,13 @@ class TestGoetGevondenClient:
         assert isinstance(info, AboutInfo)
         assert info.app_name == "Broccoli"
         assert info.version == "0.40.2"
+        assert mocked_responses.calls[0].request.headers["Accept-Encoding"] == "identity"
 
-    @responses.activate
-    def test_list_projects(self, client):
+    def test_list_projects(self, client, mocked_responses):
         """Test listing available projects."""
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://api.goetgevonden.nl/projects",
+            PROJECTS_URL,
             json=["republic"],
             status=200,
         )
@@ -59,84 +105,160 @@ class TestGoetGevondenClient:
 
         assert projects == ["republic"]
 
-    @responses.activate
-    def test_search_text(self, client):
-        """Test simple text search."""
-        responses.add(
-            responses.POST,
-            "https://api.goetgevonden.nl/projects/republic/search",
-            json={
-                "total": {"value": 100, "relation": "eq"},
-                "results": [
-                    {"_id": "1", "textType": "handgeschreven"},
-                ],
-                "aggs": {},
-            },
+    def test_read_only_endpoints_are_cached(self, client, mocked_responses):
+        """Test that cached endpoints hit the API once until invalidated."""
+        mocked_responses.add(
+            responses.GET,
+            PROJECTS_URL,
+            json=["republic"],
             status=200,
         )
 
-        results = client.search_text("Amsterdam")
+        assert client.list_projects() == ["republic"]
+        assert client.list_projects() == ["republic"]
+        assert len(mocked_responses.calls) == 1
 
-        assert isinstance(results, SearchResult)
-        assert results.total == 100
-        assert len(results.hits) == 1
+        client.invalidate_cache()
+        client.list_projects()
 
-    @responses.activate
-    def test_search_with_date_range(self, client):
-        """Test search with date range filter."""
-        responses.add(
-            responses.POST,
-            "https://api.goetgevonden.nl/projects/republic/search",
-            json={
-                "total": {"value": 50, "relation": "eq"},
-                "results": [],
-                "aggs": {},
-            },
+        assert len(mocked_responses.calls) == 2
+
+    def test_cache_key_normalizes_arguments(self, client, mocked_responses):
+        """Test that omitted, positional and keyword arguments share a cache entry."""
+        mocked_responses.add(
+            responses.GET,
+            f"{PROJECTS_URL}/republic/views",
+            json={},
             status=200,
         )
 
-        results = client.search_by_date("1600", "1650", text="oorlog")
+        client.get_views()
+        client.get_views("republic")
+        client.get_views(project_id="republic")
+
+        assert len(mocked_responses.calls) == 1
+
+    @pytest.mark.parametrize(
+        "method,args,kwargs,total,query,body",
+        [case[1:] for case in SEARCH_CASES],
+        ids=[case[0] for case in SEARCH_CASES],
+    )
+    def test_search(self, client, mocked_responses, method, args, kwargs, total, query, body):
+        """Test that the search methods send their parameters and parse the result."""
+        _add_search_response(mocked_responses, total, [{"_id": "1", "textType": "handgeschreven"}])
 
-        assert results.total == 50
+        results = getattr(client, method)(*args, **kwargs)
 
-    @responses.activate
-    def test_search_pagination(self, client):
-        """Test search pagination parameters."""
-        responses.add(
+        assert isinstance(results, SearchResult)
+        assert results.total == total
+        assert len(results.hits) == 1
+        request = mocked_responses.calls[0].request
+        for fragment in query:
+            assert fragment in request.url
+        assert json.loads(request.body) == body
+
+    def test_search_pages(self, client, mocked_responses):
+        """Test iterating over all pages of a search."""
+        for hits in ([{"_id": "1"}, {"_id": "2"}], [{"_id": "3"}]):
+            _add_search_response(mocked_responses, 3, hits)
+
+        pages = list(client.search_pages(text="Amsterdam", size=2))
+
+        assert [len(page.hits) for page in pages] == [2, 1]
+        assert "from=0" in mocked_responses.calls[0].request.url
+        assert "from=2" in mocked_responses.calls[1].request.url
+        assert mocked_responses.calls[0].request.body == mocked_responses.calls[1].request.body
+        assert mocked_responses.calls[0].request.body == b'{"text":"Amsterdam"}'
+
+    def test_search_iter(self, client, mocked_responses):
+        """Test streaming search hits."""
+        pytest.importorskip("ijson")
+        hits = [{"_id": "1", "score": 1.5}, {"_id": "2", "score": 0.5}]
+        _add_search_response(mocked_responses, 2, hits)
+
+        assert list(client.search_iter(text="Amsterdam")) == hits
+
+    @pytest.mark.parametrize(
+        "error,expected",
+        [
+            (requests.exceptions.ChunkedEncodingError("connection broken"), ConnectionError),
+            (
+                requests.exceptions.ConnectionError(
+                    ReadTimeoutError(None, None, "Read timed out.")
+                ),
+                TimeoutError,
+            ),
+        ],
+        ids=["chunked-encoding", "read-timeout"],
+    )
+    def test_search_iter_stream_errors(
+        self, client, mocked_responses, monkeypatch, error, expected
+    ):
+        """Test that errors raised while streaming the body become client exceptions."""
+        pytest.importorskip("ijson")
+        _add_search_response(mocked_responses, 2, [{"_id": "1"}])
+
+        def iter_content(self, chunk_size=1):
+            yield b'{"results": ['
+            raise error
+
+        monkeypatch.setattr(requests.Response, "iter_content", iter_content)
+
+        with pytest.raises(expected):
+            list(client.search_iter(text="Amsterdam"))
+
+    def test_get_annotations_bulk(self, client, mocked_responses):
+        """Test fetching annotations for several body IDs."""
+        for body_id in ("a", "b", "c"):
+            mocked_responses.add(
+                responses.GET,
+                f"{PROJECTS_URL}/republic/{body_id}",
+                json={"bodyId": body_id},
+                status=200,
+            )
+
+        annotations = client.get_annotations_bulk(["a", "b", "c"], max_workers=2)
+
+        assert annotations == {body_id: {"bodyId": body_id} for body_id in ("a", "b", "c")}
+        assert all("relativeTo=Origin" in call.request.url for call in mocked_responses.calls)
+
+    def test_index_management_params(self, client, mocked_responses):
+        """Test that index endpoints only send the optional params that are given."""
+        mocked_responses.add(
+            responses.DELETE,
+            f"{BASE_URL}/brinta/republic/test-index",
+            json={},
+            status=200,
+        )
+        mocked_responses.add(
             responses.POST,
-            "https://api.goetgevonden.nl/projects/republic/search",
-            json={
-                "total": {"value": 1000, "relation": "eq"},
-                "results": [],
-                "aggs": {},
-            },
+            f"{BASE_URL}/brinta/republic/test-index/fill",
+            json={},
             status=200,
         )
 
-        results = client.search(from_=20, size=10)
+        client.delete_index("test-index")
+        client.fill_index("test-index", take=5)
 
-        # Check that pagination params were sent
-        assert "from=20" in responses.calls[0].request.url
-        assert "size=10" in responses.calls[0].request.url
+        assert mocked_responses.calls[0].request.url.endswith("/brinta/republic/test-index")
+        assert mocked_responses.calls[1].request.url.endswith("/fill?take=5")
 
-    @responses.activate
-    def test_not_found_error(self, client):
+    def test_not_found_error(self, client, mocked_responses):
         """Test 404 response handling."""
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://api.goetgevonden.nl/projects/nonexistent",
+            f"{PROJECTS_URL}/nonexistent",
             status=404,
         )
 
         with pytest.raises(NotFoundError):
             client.get_project_body_types("nonexistent")
 
-    @responses.activate
-    def test_api_error(self, client):
+    def test_api_error(self, client, mocked_responses):
         """Test API error response handling."""
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://api.goetgevonden.nl/projects",
+            PROJECTS_URL,
             json={"error": "Internal server error"},
             status=500,
         )
@@ -146,87 +268,173 @@ class TestGoetGevondenClient:
 
         assert exc_info.value.status_code == 500
 
-    def test_context_manager(self):
-        """Test using client as context manager."""
-        with GoetGevondenClient() as client:
-            assert client is not None
-        # Session should be closed after exiting context
-
-    def test_validation_error_negative_from(self, client):
-        """Test validation of negative from_ parameter."""
-        from goetgevonden import ValidationError
-
-        with pytest.raises(ValidationError):
-            client.search(from_=-1)
-
-    def test_validation_error_negative_size(self, client):
-        """Test validation of negative size parameter."""
-        from goetgevonden import ValidationError
-
-        with pytest.raises(ValidationError):
-            client.search(size=-1)
-
+    def test_retries_transient_errors(self, client, mocked_responses):
+        """Test that transient 503 responses are retried."""
+        mocked_responses.add(
+            responses.GET,
+            PROJECTS_URL,
+            status=503,
+        )
+        mocked_responses.add(
+            responses.GET,
+            PROJECTS_URL,
+            json=["republic"],
+            status=200,
+        )
 
-class TestModels:
-    """Test suite for data models."""
+        projects = client.list_projects()
 
-    def test_index_range_to_dict(self):
-        """Test IndexRange serialization."""
-        range_ = IndexRange(name="date", from_value="1600", to_value="1650")
-        result = range_.to_dict()
+        assert projects == ["republic"]
+        assert len(mocked_responses.calls) == 2
+
+    def test_read_timeout_is_not_retried(self, mocked_responses):
+        """Test that a read timeout raises TimeoutError without replaying the request."""
+        server = socket.create_server(("127.0.0.1", 0))
+        connections = []
+
+        def accept_and_stall():
+            # Accept every connection but never answer, so the client's read times out
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                connections.append(conn)
+
+        threading.Thread(target=accept_and_stall, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.getsockname()[1]}"
+        mocked_responses.add_passthru(base_url)
+
+        try:
+            with (
+                GoetGevondenClient(base_url=base_url, timeout=0.2) as client,
+                pytest.raises(TimeoutError),
+            ):
+                client.fill_index("my-index")
+        finally:
+            server.close()
+            for conn in connections:
+                conn.close()
+
+        assert len(connections) == 1
+
+    def test_non_json_response_returns_text(self, client, mocked_responses):
+        """Test that non-JSON response bodies are returned as text."""
+        mocked_responses.add(
+            responses.GET,
+            f"{PROJECTS_URL}/republic",
+            body="not json",
+            status=200,
+        )
 
-        assert result == {"name": "date", "from": "1600", "to": "1650"}
+        result = client.get_project_body_types("republic")
 
-    def test_index_range_partial(self):
-        """Test IndexRange with partial values."""
-        range_ = IndexRange(name="date", from_value="1600")
-        result = range_.to_dict()
+        assert result == "not json"
 
-        assert result == {"name": "date", "from": "1600"}
-        assert "to" not in result
+    def test_http2_transport(self, monkeypatch):
+        """Test that HTTP/2 requests carry the session headers and query params."""
+        httpx = pytest.importorskip("httpx")
 
-    def test_search_result_from_dict_broccoli_format(self):
-        """Test SearchResult parsing with Broccoli API format."""
-        data = {
-            "total": {"value": 42, "relation": "eq"},
-            "results": [{"_id": "1"}],
-            "aggs": {"test": {}},
-        }
+        def handler(request):
+            assert request.headers["Accept"] == "application/json"
+            assert request.headers["Content-Type"] == "application/json"
+            assert request.url.params["relativeTo"] == "Origin"
+            return httpx.Response(200, json={"bodyId": "body-1"})
 
-        result = SearchResult.from_dict(data)
+        with _http2_client(monkeypatch, httpx.MockTransport(handler)) as client:
+            assert client.get_annotations("body-1") == {"bodyId": "body-1"}
 
-        assert result.total == 42
-        assert len(result.hits) == 1
-        assert result.aggregations == {"test": {}}
+    @pytest.mark.parametrize(
+        "error,expected",
+        [("ReadTimeout", TimeoutError), ("ConnectError", ConnectionError)],
+    )
+    def test_http2_transport_errors(self, monkeypatch, error, expected):
+        """Test that httpx transport errors surface as the client's exceptions."""
+        httpx = pytest.importorskip("httpx")
 
-    def test_search_result_from_dict_elasticsearch_format(self):
-        """Test SearchResult parsing with Elasticsearch format."""
-        data = {
-            "hits": {
-                "total": {"value": 42},
-                "hits": [{"_id": "1"}],
-            },
-            "aggregations": {"test": {}},
-        }
+        def handler(request):
+            raise getattr(httpx, error)("failed", request=request)
 
-        result = SearchResult.from_dict(data)
+        with (
+            _http2_client(monkeypatch, httpx.MockTransport(handler)) as client,
+            pytest.raises(expected),
+        ):
+            client.list_projects()
 
-        assert result.total == 42
-        assert len(result.hits) == 1
-        assert result.aggregations == {"test": {}}
+    @pytest.mark.parametrize(
+        "error,expected",
+        [("ReadTimeout", "Timeout"), ("RemoteProtocolError", "ConnectionError")],
+    )
+    def test_http2_streaming_errors(self, error, expected):
+        """Test that httpx errors raised while streaming a body become requests exceptions."""
+        httpx = pytest.importorskip("httpx")
+        import requests
+
+        from goetgevonden._http2 import HTTP2Session
+
+        class FailingStream(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b'{"results": ['
+                raise getattr(httpx, error)("stream interrupted")
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=FailingStream()))
+        session = HTTP2Session(transport=transport)
+
+        with (
+            session.request("POST", SEARCH_URL, stream=True) as response,
+            pytest.raises(getattr(requests.exceptions, expected)),
+        ):
+            list(response.iter_content(chunk_size=16))
+        session.close()
+
+    def test_http2_follows_redirects(self, monkeypatch):
+        """Test that the HTTP/2 transport follows redirects like requests does."""
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            if request.url.path == "/":
+                return httpx.Response(301, headers={"Location": f"{BASE_URL}/home"})
+            return httpx.Response(200, text="<html>GoetGevonden</html>")
+
+        with _http2_client(monkeypatch, httpx.MockTransport(handler)) as client:
+            assert client.get_home_page() == "<html>GoetGevonden</html>"
+
+    def test_http2_search_iter(self, monkeypatch):
+        """Test streaming search hits over the HTTP/2 transport."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("ijson")
+        hits = [{"_id": "1", "score": 1.5}, {"_id": "2", "score": 0.5}]
+
+        def handler(request):
+            assert json.loads(request.content) == {"text": "Amsterdam"}
+            return httpx.Response(200, json=_search_body(2, hits))
+
+        with _http2_client(monkeypatch, httpx.MockTransport(handler)) as client:
+            assert list(client.search_iter(text="Amsterdam")) == hits
+
+    def test_http2_rejects_custom_session(self):
+        """Test that http2 cannot be combined with a custom session."""
+        import requests
 
-    def test_about_info_from_dict(self):
-        """Test AboutInfo parsing."""
-        data = {
-            "appName": "Broccoli",
-            "version": "1.0.0",
-            "startedAt": "2024-01-01",
-            "baseURI": "http://localhost",
-            "hucLogLevel": "DEBUG",
-        }
+        with pytest.raises(ValidationError):
+            GoetGevondenClient(session=requests.Session(), http2=True)
 
-        info = AboutInfo.from_dict(data)
+    def test_context_manager(self):
+        """Test using client as context manager."""
+        with GoetGevondenClient() as client:
+            assert client is not None
+        # Session should be closed after exiting context
 
-        assert info.app_name == "Broccoli"
-        assert info.version == "1.0.0"
-        assert info.huc_log_level == "DEBUG"
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"from_": -1},
+            {"size": -1},
+            {"value_range": IndexRange(name="year", from_value=float("nan"), to_value=1700)},
+        ],
+        ids=["from", "size", "nan"],
+    )
+    def test_search_validation_error(self, client, kwargs):
+        """Test validation of negative pagination parameters and non-finite values."""
+        with pytest.raises(ValidationError):
+            client.search(**kwargs)
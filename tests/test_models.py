@@ -0,0 +1,160 @@
+"""Tests for the GoetGevonden data models."""
+
+import pytest
+
+from goetgevonden import (
+    AboutInfo,
+    IndexQuery,
+    IndexRange,
+    SearchResult,
+    ViewAnnoConstraint,
+    ViewConfiguration,
+    ViewScope,
+)
+
+
+class TestModels:
+    """Test suite for data models."""
+
+    def test_index_range_to_dict(self):
+        """Test IndexRange serialization."""
+        range_ = IndexRange(name="date", from_value="1600", to_value="1650")
+        result = range_.to_dict()
+
+        assert result == {"name": "date", "from": "1600", "to": "1650"}
+
+    def test_index_range_partial(self):
+        """Test IndexRange with partial values."""
+        range_ = IndexRange(name="date", from_value="1600")
+        result = range_.to_dict()
+
+        assert result == {"name": "date", "from": "1600"}
+        assert "to" not in result
+
+    def test_index_query_to_dict(self):
+        """Test IndexQuery serialization skips unset fields."""
+        query = IndexQuery(
+            text="oorlog",
+            date=IndexRange(name="date", from_value="1600", to_value="1650"),
+        )
+
+        assert query.to_dict() == {
+            "text": "oorlog",
+            "date": {"name": "date", "from": "1600", "to": "1650"},
+        }
+
+    def test_search_result_from_dict_broccoli_format(self):
+        """Test SearchResult parsing with Broccoli API format."""
+        data = {
+            "total": {"value": 42, "relation": "eq"},
+            "results": [{"_id": "1"}],
+            "aggs": {"test": {}},
+        }
+
+        result = SearchResult.from_dict(data)
+
+        assert result.total == 42
+        assert len(result.hits) == 1
+        assert result.aggregations == {"test": {}}
+
+    def test_search_result_from_dict_elasticsearch_format(self):
+        """Test SearchResult parsing with Elasticsearch format."""
+        data = {
+            "hits": {
+                "total": {"value": 42},
+                "hits": [{"_id": "1"}],
+            },
+            "aggregations": {"test": {}},
+        }
+
+        result = SearchResult.from_dict(data)
+
+        assert result.total == 42
+        assert len(result.hits) == 1
+        assert result.aggregations == {"test": {}}
+
+    def test_search_result_interns_keyword_values(self):
+        """Test that repeated keyword values are shared between hits."""
+        data = {
+            "total": 2,
+            "results": [
+                {"_id": "1", "textType": "".join(["hand", "geschreven"])},
+                {"_id": "2", "textType": "".join(["hand", "geschreven"])},
+            ],
+        }
+
+        result = SearchResult.from_dict(data)
+
+        assert result.hits[0]["textType"] is result.hits[1]["textType"]
+
+    def test_search_result_keeps_non_document_hits(self):
+        """Test that hits which are not documents are passed through unchanged."""
+        data = {
+            "total": 3,
+            "results": ["id-1", {"_id": "2", "_source": None, "textType": "gedrukt"}, None],
+        }
+
+        result = SearchResult.from_dict(data)
+
+        assert result.hits == data["results"]
+
+    def test_search_result_raw_response_opt_in(self):
+        """Test that the raw response is only kept when requested."""
+        data = {
+            "total": {"value": 1, "relation": "eq"},
+            "results": [{"_id": "1"}],
+            "aggs": {},
+        }
+
+        result = SearchResult.from_dict(data)
+        kept = SearchResult.from_dict(data, keep_raw=True)
+
+        assert result.raw_response == {}
+        assert result.meta == {"total": {"value": 1, "relation": "eq"}, "aggs": {}}
+        assert kept.raw_response is data
+
+    def test_view_configuration_from_dict(self):
+        """Test ViewConfiguration parsing, including incomplete constraints."""
+        data = {
+            "anno": [
+                {"path": "body.type", "value": "Resolution"},
+                {"path": "body.metadata.session"},
+            ],
+            "scope": "WITHIN",
+        }
+
+        config = ViewConfiguration.from_dict(data)
+
+        assert config.anno == [
+            ViewAnnoConstraint(path="body.type", value="Resolution"),
+            ViewAnnoConstraint(path="body.metadata.session", value=""),
+        ]
+        assert config.scope == ViewScope.WITHIN
+
+    def test_view_configuration_invalid_scope(self):
+        """Test that unknown view scopes are rejected."""
+        with pytest.raises(ValueError):
+            ViewConfiguration.from_dict({"anno": [], "scope": "EVERYWHERE"})
+
+    def test_models_use_slots(self):
+        """Test that model instances do not carry a per-instance __dict__."""
+        result = SearchResult.from_dict({"total": 0, "results": []})
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(IndexRange(name="date"), "__dict__")
+
+    def test_about_info_from_dict(self):
+        """Test AboutInfo parsing."""
+        data = {
+            "appName": "Broccoli",
+            "version": "1.0.0",
+            "startedAt": "2024-01-01",
+            "baseURI": "http://localhost",
+            "hucLogLevel": "DEBUG",
+        }
+
+        info = AboutInfo.from_dict(data)
+
+        assert info.app_name == "Broccoli"
+        assert info.version == "1.0.0"
+        assert info.huc_log_level == "DEBUG"